@@ -13,12 +13,15 @@ All parameter mapping and prompt generation is deterministic via ologs.
 """
 
 from fastmcp import FastMCP
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
+import functools
 import json
 
 # Import olog system (Layer 1: Categorical Taxonomy)
 from slapstick_ologs import (
-    SlapstickOlogMorphisms,
+    design_intent_to_parameters,
+    validate_parameters,
+    parameters_to_enhancement_description,
     SubjectType,
     EmotionalTone,
     VisualPriority,
@@ -31,10 +34,45 @@ from slapstick_ologs import (
 mcp = FastMCP("slapstick-enhancer")
 
 
+def _enum_lookup(enum_cls) -> Dict[str, Any]:
+    """Case-insensitive map from member value or name to enum member"""
+    return {key.lower(): member for member in enum_cls for key in (member.value, member.name)}
+
+
+# Precomputed string -> enum resolution for tool inputs
+_SUBJECT_LOOKUP = _enum_lookup(SubjectType)
+_EMOTION_LOOKUP = _enum_lookup(EmotionalTone)
+_INTENSITY_LOOKUP = _enum_lookup(IntensityLevel)
+# Priorities arrive as lists, so also key the upper-case and title-case
+# spellings to let common inputs hit directly without a .lower() per item
+_PRIORITY_LOOKUP = {
+    key: vp
+    for vp in VisualPriority
+    for key in (vp.value, vp.value.upper(), vp.value.title(), vp.name, vp.name.lower())
+}
+
+# Valid design intent options are fixed for the process lifetime
+_AVAILABLE_OPTIONS = {
+    "subject_types": tuple(st.value for st in SubjectType),
+    "emotional_tones": tuple(et.value for et in EmotionalTone),
+    "visual_priorities": tuple(vp.value for vp in VisualPriority),
+    "intensity_levels": tuple(il.value for il in IntensityLevel),
+}
+
+
 # ============================================================================
 # LAYER 2: PROMPT ENHANCEMENT TEMPLATES
 # ============================================================================
 
+def _expand(ranges: Dict) -> tuple:
+    """Expand {(min, max): text} ranges into a table indexed by value 0-10"""
+    text_for = {}
+    for (min_val, max_val), text in ranges.items():
+        for value in range(min_val, max_val + 1):
+            text_for[value] = text
+    return tuple(text_for.get(i, "") for i in range(11))
+
+
 class SlapstickPromptTemplates:
     """
     Pre-crafted enhancement text at each parameter level.
@@ -47,6 +85,7 @@ class SlapstickPromptTemplates:
         (3, 5): "subtle scale variations and slightly heightened color saturation",
         (0, 2): "realistic proportions and natural color",
     }
+    EXAGGERATION_TABLE = _expand(EXAGGERATION_TEMPLATES)
     
     TIMING_TEMPLATES = {
         (9, 10): "staccato visual interruptions, dramatic motion blur on static objects, speed lines suggesting imminent action",
@@ -54,6 +93,7 @@ class SlapstickPromptTemplates:
         (3, 5): "gentle repetition of visual elements creating compositional rhythm",
         (0, 2): "static composition without temporal elements",
     }
+    TIMING_TABLE = _expand(TIMING_TEMPLATES)
     
     PHYSICAL_TEMPLATES = {
         (9, 10): "extreme elasticity and squash-stretch distortion, mid-collision freeze-frame moment, materials stretched or compressed cartoonishly, complete defiance of physics",
@@ -61,6 +101,7 @@ class SlapstickPromptTemplates:
         (3, 5): "subtle material flexibility, slight impossibilities in physics",
         (0, 2): "realistic physics and rigid materials",
     }
+    PHYSICAL_TABLE = _expand(PHYSICAL_TEMPLATES)
     
     RULE_OF_THREE_TEMPLATES = {
         (9, 10): "complex establish-repeat-subvert patterns, three-part visual jokes in composition, triple visual callbacks, all using rule of thirds positioning",
@@ -68,6 +109,7 @@ class SlapstickPromptTemplates:
         (3, 5): "subtle hints of grouping in threes, occasional triplet arrangement",
         (0, 2): "no emphasis on triplet groupings",
     }
+    RULE_OF_THREE_TABLE = _expand(RULE_OF_THREE_TEMPLATES)
     
     READABILITY_TEMPLATES = {
         (9, 10): "crystal clear graphic simplification and silhouette clarity, high contrast separating subject from background, visual clarity even from distance",
@@ -75,6 +117,7 @@ class SlapstickPromptTemplates:
         (3, 5): "subtle graphic emphasis with readable forms",
         (0, 2): "complex visual details without simplification",
     }
+    READABILITY_TABLE = _expand(READABILITY_TEMPLATES)
     
     TENSION_TEMPLATES = {
         (9, 10): "extreme precarious balance suggesting imminent collapse, maximum suspense and about-to-happen energy, frozen moment of chaos",
@@ -82,6 +125,7 @@ class SlapstickPromptTemplates:
         (3, 5): "subtle underlying tension and unease",
         (0, 2): "peaceful balanced composition",
     }
+    TENSION_TABLE = _expand(TENSION_TEMPLATES)
     
     NEGATIVE_PROMPT_COMPONENTS = {
         'high_exaggeration': "realistic proportions, natural colors, subtle",
@@ -93,99 +137,146 @@ class SlapstickPromptTemplates:
     }
     
     @staticmethod
-    def get_template(param_value: int, templates: Dict) -> str:
-        """Get template text based on parameter value"""
-        for (min_val, max_val), text in sorted(templates.items(), reverse=True):
-            if min_val <= param_value <= max_val:
-                return text
+    def get_template(param_value: int, table: tuple) -> str:
+        """Get template text based on parameter value (0-10); "" outside that range"""
+        if 0 <= param_value <= 10:
+            return table[param_value]
         return ""
     
     @staticmethod
-    def build_enhanced_prompt(base_prompt: str, params: SlapstickParameterSet) -> str:
-        """Deterministically build enhanced prompt from parameters"""
-        additions = []
+    def build_prompts(
+        base_prompt: str,
+        params: SlapstickParameterSet,
+        needs_negative: bool = True
+    ) -> Tuple[str, str]:
+        """
+        Deterministically build enhanced and negative prompts in one pass.
+        The negative prompt is returned as "" when needs_negative is False.
+        All-zero parameters mean no slapstick treatment: the base prompt is
+        returned unchanged with only the general negatives.
+        """
+        if not any(params):
+            return base_prompt, _DEFAULT_NEGATIVE if needs_negative else ""
         
-        # Add exaggeration enhancement
-        exag_text = SlapstickPromptTemplates.get_template(
-            params.exaggeration, 
-            SlapstickPromptTemplates.EXAGGERATION_TEMPLATES
-        )
-        if exag_text:
-            additions.append(exag_text)
-        
-        # Add timing enhancement
-        timing_text = SlapstickPromptTemplates.get_template(
+        return _build_cached(
+            base_prompt,
+            params.exaggeration,
             params.timing,
-            SlapstickPromptTemplates.TIMING_TEMPLATES
-        )
-        if timing_text:
-            additions.append(timing_text)
-        
-        # Add physical comedy enhancement
-        physical_text = SlapstickPromptTemplates.get_template(
             params.physical,
-            SlapstickPromptTemplates.PHYSICAL_TEMPLATES
-        )
-        if physical_text:
-            additions.append(physical_text)
-        
-        # Add rule of three enhancement
-        rot_text = SlapstickPromptTemplates.get_template(
             params.ruleOfThree,
-            SlapstickPromptTemplates.RULE_OF_THREE_TEMPLATES
-        )
-        if rot_text:
-            additions.append(rot_text)
-        
-        # Add readability enhancement
-        read_text = SlapstickPromptTemplates.get_template(
             params.readability,
-            SlapstickPromptTemplates.READABILITY_TEMPLATES
-        )
-        if read_text:
-            additions.append(read_text)
-        
-        # Add tension enhancement
-        tension_text = SlapstickPromptTemplates.get_template(
             params.tension,
-            SlapstickPromptTemplates.TENSION_TEMPLATES
+            needs_negative,
         )
-        if tension_text:
-            additions.append(tension_text)
-        
-        # Combine base prompt with enhancements
-        if additions:
-            return f"{base_prompt}, {', '.join(additions)}"
-        return base_prompt
+    
+    @staticmethod
+    def build_enhanced_prompt(base_prompt: str, params: SlapstickParameterSet) -> str:
+        """Deterministically build enhanced prompt from parameters"""
+        return SlapstickPromptTemplates.build_prompts(base_prompt, params, False)[0]
     
     @staticmethod
     def build_negative_prompt(params: SlapstickParameterSet) -> str:
         """Deterministically build negative prompt from parameters"""
-        negatives = []
-        
-        # Add negatives based on high parameter values
-        if params.exaggeration >= 6:
-            negatives.append(SlapstickPromptTemplates.NEGATIVE_PROMPT_COMPONENTS['high_exaggeration'])
+        return SlapstickPromptTemplates.build_prompts("", params)[1]
+
+
+# Flat tables in parameter order for the specialized builder below
+_TABLES = (
+    SlapstickPromptTemplates.EXAGGERATION_TABLE,
+    SlapstickPromptTemplates.TIMING_TABLE,
+    SlapstickPromptTemplates.PHYSICAL_TABLE,
+    SlapstickPromptTemplates.RULE_OF_THREE_TABLE,
+    SlapstickPromptTemplates.READABILITY_TABLE,
+    SlapstickPromptTemplates.TENSION_TABLE,
+)
+_BASE_NEGATIVES = ("blurry", "low quality", "distorted", "ugly")
+_DEFAULT_NEGATIVE = ", ".join(_BASE_NEGATIVES)
+
+# Negative components and the value at which each applies, in parameter order
+_NEGATIVE_TEXTS = tuple(
+    SlapstickPromptTemplates.NEGATIVE_PROMPT_COMPONENTS[key]
+    for key in (
+        'high_exaggeration',
+        'high_timing',
+        'high_physical',
+        'high_rule_of_three',
+        'low_readability',
+        'high_tension',
+    )
+)
+_NEGATIVE_THRESHOLDS = (6, 6, 6, 6, 8, 6)
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_cached(
+    base_prompt: str,
+    exaggeration: int,
+    timing: int,
+    physical: int,
+    ruleOfThree: int,
+    readability: int,
+    tension: int,
+    needs_negative: bool,
+) -> Tuple[str, str]:
+    """
+    Build (enhanced, negative) prompts from a base prompt and six parameter values.
+    Pure function of its arguments, so repeat requests are served from the cache.
+    Negative assembly is skipped (returning "") when needs_negative is False.
+    The enhanced prompt is written straight-line (one block per parameter, in
+    prompt order) so each step is a direct table index.
+    """
+    values = (exaggeration, timing, physical, ruleOfThree, readability, tension)
+    
+    if 0 <= min(values) and max(values) <= 10:
+        # Bind the tables to locals once; the blocks below then index fast locals
+        exaggeration_table, timing_table, physical_table, rot_table, readability_table, tension_table = _TABLES
         
-        if params.timing >= 6:
-            negatives.append(SlapstickPromptTemplates.NEGATIVE_PROMPT_COMPONENTS['high_timing'])
+        # Seed the list so the prompt is produced by a single join
+        parts = [base_prompt]
+        append = parts.append
         
-        if params.physical >= 6:
-            negatives.append(SlapstickPromptTemplates.NEGATIVE_PROMPT_COMPONENTS['high_physical'])
+        text = exaggeration_table[exaggeration]
+        if text:
+            append(text)
         
-        if params.ruleOfThree >= 6:
-            negatives.append(SlapstickPromptTemplates.NEGATIVE_PROMPT_COMPONENTS['high_rule_of_three'])
+        text = timing_table[timing]
+        if text:
+            append(text)
         
-        if params.readability >= 8:
-            negatives.append(SlapstickPromptTemplates.NEGATIVE_PROMPT_COMPONENTS['low_readability'])
+        text = physical_table[physical]
+        if text:
+            append(text)
         
-        if params.tension >= 6:
-            negatives.append(SlapstickPromptTemplates.NEGATIVE_PROMPT_COMPONENTS['high_tension'])
+        text = rot_table[ruleOfThree]
+        if text:
+            append(text)
         
-        # Always include general negatives
-        base_negatives = ["blurry", "low quality", "distorted", "ugly"]
+        text = readability_table[readability]
+        if text:
+            append(text)
         
-        return ", ".join(base_negatives + negatives) if negatives else ", ".join(base_negatives)
+        text = tension_table[tension]
+        if text:
+            append(text)
+    else:
+        # Out-of-range values get no template text, as with the original range lookup
+        parts = [base_prompt]
+        for table, value in zip(_TABLES, values):
+            if 0 <= value <= 10 and table[value]:
+                parts.append(table[value])
+    
+    if not needs_negative:
+        return ", ".join(parts), ""
+    
+    negatives = []
+    for value, threshold, text in zip(values, _NEGATIVE_THRESHOLDS, _NEGATIVE_TEXTS):
+        if value >= threshold:
+            negatives.append(text)
+    
+    # Always include general negatives (joined once at import)
+    if not negatives:
+        return ", ".join(parts), _DEFAULT_NEGATIVE
+    return ", ".join(parts), _DEFAULT_NEGATIVE + ", " + ", ".join(negatives)
 
 
 # ============================================================================
@@ -198,7 +289,8 @@ def enhance_with_intent(
     subject_type: str,
     emotional_tone: str,
     visual_priorities: List[str],
-    intensity: str
+    intensity: str,
+    include_negative: bool = True
 ) -> Dict[str, Any]:
     """
     Enhance an image prompt with slapstick design principles based on design intent.
@@ -209,30 +301,43 @@ def enhance_with_intent(
         base_prompt: The original image description (e.g., "A corporate office")
         subject_type: Category of subject - architecture, portrait, still_life, landscape, abstract, product, scene
         emotional_tone: Emotional quality - playful, tense, absurd, whimsical, surreal, dramatic, chaotic, elegant, ominous
-        visual_priorities: List of priorities to emphasize (1-3 recommended) - scale, physics, repetition, clarity, suspense, rhythm, distortion, balance, flow, impact
+        visual_priorities: List of priorities to emphasize (1-3 recommended, repeats count once) - scale, physics, repetition, clarity, suspense, rhythm, distortion, balance, flow, impact
         intensity: Overall intensity level - subtle, moderate, strong, extreme
+        include_negative: Whether to build the negative prompt (set False if only the enhanced prompt is needed)
     
     Returns:
         Dictionary with:
         - parameters_used: The calculated slapstick parameters
         - enhanced_prompt: The enhanced image prompt
-        - negative_prompt: Suggested negative prompt to prevent unwanted effects
+        - negative_prompt: Suggested negative prompt to prevent unwanted effects (only if include_negative)
         - design_intent_summary: Human-readable explanation of choices
     """
     
     try:
         # Convert string inputs to enums
-        subject = SubjectType[subject_type.upper()]
-        emotion = EmotionalTone[emotional_tone.upper()]
-        intensity_level = IntensityLevel[intensity.upper()]
+        subject = _SUBJECT_LOOKUP.get(subject_type.lower())
+        if subject is None:
+            return {"error": f"Invalid subject type: {subject_type}"}
+        emotion = _EMOTION_LOOKUP.get(emotional_tone.lower())
+        if emotion is None:
+            return {"error": f"Invalid emotional tone: {emotional_tone}"}
+        intensity_level = _INTENSITY_LOOKUP.get(intensity.lower())
+        if intensity_level is None:
+            return {"error": f"Invalid intensity: {intensity}"}
         
-        # Convert visual priorities to enums
+        # Convert visual priorities to enums, collecting summary values in the same pass
         priorities = []
+        priority_values = []
+        lookup = _PRIORITY_LOOKUP
         for priority_str in visual_priorities:
-            try:
-                priorities.append(VisualPriority[priority_str.upper()])
-            except KeyError:
-                return {"error": f"Invalid visual priority: {priority_str}"}
+            priority = lookup.get(priority_str)
+            if priority is None:
+                try:
+                    priority = lookup[priority_str.lower()]
+                except KeyError:
+                    return {"error": f"Invalid visual priority: {priority_str}"}
+            priorities.append(priority)
+            priority_values.append(priority.value)
         
         # Create design intent using ologs
         design_intent = DesignIntent(
@@ -243,29 +348,33 @@ def enhance_with_intent(
         )
         
         # Map intent to parameters using deterministic morphism
-        params = SlapstickOlogMorphisms.design_intent_to_parameters(design_intent)
+        params = design_intent_to_parameters(design_intent)
         
-        # Validate parameters
-        if not SlapstickOlogMorphisms.validate_parameters(params):
-            return {"error": "Invalid parameters generated"}
+        # Morphisms clamp to 0-10 by construction; checked only in debug runs
+        assert validate_parameters(params), "Invalid parameters generated"
         
         # Generate enhanced prompt using templates
-        enhanced_prompt = SlapstickPromptTemplates.build_enhanced_prompt(base_prompt, params)
-        negative_prompt = SlapstickPromptTemplates.build_negative_prompt(params)
+        enhanced_prompt, negative_prompt = SlapstickPromptTemplates.build_prompts(
+            base_prompt, params, include_negative
+        )
         
         # Create summary
-        visual_priorities_str = ", ".join([p.value for p in priorities]) if priorities else "none specified"
+        # Repeats count once, matching the deduplicated priorities in design_intent
+        visual_priorities_str = ", ".join(dict.fromkeys(priority_values)) if priority_values else "none specified"
         summary = (
-            f"Applied {intensity_level.value} {emotional_tone.value} treatment to "
-            f"{subject_type}, emphasizing {visual_priorities_str}"
+            f"Applied {intensity_level.value} {emotion.value} treatment to "
+            f"{subject.value}, emphasizing {visual_priorities_str}"
         )
         
-        return {
+        result = {
             "parameters_used": params.to_dict(),
             "enhanced_prompt": enhanced_prompt,
-            "negative_prompt": negative_prompt,
-            "design_intent_summary": summary
         }
+        if include_negative:
+            result["negative_prompt"] = negative_prompt
+        result["design_intent_summary"] = summary
+        
+        return result
     
     except ValueError as e:
         return {"error": f"Invalid input: {str(e)}"}
@@ -279,7 +388,8 @@ def enhance_with_parameters(
     physical: int = 5,
     ruleOfThree: int = 5,
     readability: int = 5,
-    tension: int = 5
+    tension: int = 5,
+    include_negative: bool = True
 ) -> Dict[str, Any]:
     """
     Enhance an image prompt with explicit slapstick parameter values.
@@ -295,6 +405,8 @@ def enhance_with_parameters(
     - readability: Silhouette clarity, graphic simplification
     - tension: Precarious balance, suspense, about-to-happen moments
     
+    Setting all six to 0 leaves the base prompt unchanged.
+    
     Args:
         base_prompt: The original image description
         exaggeration: Scale distortion level (0-10)
@@ -303,38 +415,40 @@ def enhance_with_parameters(
         ruleOfThree: Triplet pattern level (0-10)
         readability: Graphic clarity level (0-10)
         tension: Suspense/precarious balance level (0-10)
+        include_negative: Whether to build the negative prompt (set False if only the enhanced prompt is needed)
     
     Returns:
         Dictionary with:
         - parameters_used: The slapstick parameters
         - enhanced_prompt: The enhanced image prompt
-        - negative_prompt: Suggested negative prompt
+        - negative_prompt: Suggested negative prompt (only if include_negative)
     """
     
     try:
-        # Create parameter set
+        # Create parameter set (clamped to 0-10, so always valid).
+        # Positional in field order: NamedTuple keyword construction is about 2x slower
         params = SlapstickParameterSet(
-            exaggeration=max(0, min(10, int(exaggeration))),
-            timing=max(0, min(10, int(timing))),
-            physical=max(0, min(10, int(physical))),
-            ruleOfThree=max(0, min(10, int(ruleOfThree))),
-            readability=max(0, min(10, int(readability))),
-            tension=max(0, min(10, int(tension)))
+            max(0, min(10, int(exaggeration))),
+            max(0, min(10, int(timing))),
+            max(0, min(10, int(physical))),
+            max(0, min(10, int(ruleOfThree))),
+            max(0, min(10, int(readability))),
+            max(0, min(10, int(tension)))
         )
         
-        # Validate parameters
-        if not params.validate():
-            return {"error": "Parameters must be between 0 and 10"}
-        
         # Generate enhanced prompt using templates
-        enhanced_prompt = SlapstickPromptTemplates.build_enhanced_prompt(base_prompt, params)
-        negative_prompt = SlapstickPromptTemplates.build_negative_prompt(params)
+        enhanced_prompt, negative_prompt = SlapstickPromptTemplates.build_prompts(
+            base_prompt, params, include_negative
+        )
         
-        return {
+        result = {
             "parameters_used": params.to_dict(),
             "enhanced_prompt": enhanced_prompt,
-            "negative_prompt": negative_prompt
         }
+        if include_negative:
+            result["negative_prompt"] = negative_prompt
+        
+        return result
     
     except (ValueError, TypeError) as e:
         return {"error": f"Invalid parameter value: {str(e)}"}
@@ -367,16 +481,18 @@ def describe_parameters(
     """
     
     try:
+        # Positional in field order: NamedTuple keyword construction is about 2x slower
         params = SlapstickParameterSet(
-            exaggeration=max(0, min(10, int(exaggeration))),
-            timing=max(0, min(10, int(timing))),
-            physical=max(0, min(10, int(physical))),
-            ruleOfThree=max(0, min(10, int(ruleOfThree))),
-            readability=max(0, min(10, int(readability))),
-            tension=max(0, min(10, int(tension)))
+            max(0, min(10, int(exaggeration))),
+            max(0, min(10, int(timing))),
+            max(0, min(10, int(physical))),
+            max(0, min(10, int(ruleOfThree))),
+            max(0, min(10, int(readability))),
+            max(0, min(10, int(tension)))
         )
         
-        descriptions = SlapstickOlogMorphisms.parameters_to_enhancement_description(params)
+        # Shared read-only descriptions; mappingproxy.copy() gives this response its own dict
+        descriptions = parameters_to_enhancement_description(params).copy()
         descriptions['parameters'] = params.to_dict()
         
         return descriptions
@@ -386,20 +502,15 @@ def describe_parameters(
 
 
 @mcp.tool()
-def get_available_options() -> Dict[str, List[str]]:
+def get_available_options() -> Dict[str, Tuple[str, ...]]:
     """
     Get all available options for design intent parameters.
     
     Returns:
-        Dictionary with lists of valid values for each parameter type
+        Dictionary with a tuple of valid values for each parameter type
     """
     
-    return {
-        "subject_types": [st.value for st in SubjectType],
-        "emotional_tones": [et.value for et in EmotionalTone],
-        "visual_priorities": [vp.value for vp in VisualPriority],
-        "intensity_levels": [il.value for il in IntensityLevel],
-    }
+    return dict(_AVAILABLE_OPTIONS)
 
 
 if __name__ == "__main__":
@@ -12,8 +12,12 @@ This olog formalizes the semantic relationships between:
 Using category theory principles to create deterministic parameter mappings.
 """
 
+import functools
+import sys
+from bisect import bisect_right
 from enum import Enum
-from typing import List, Dict, Literal
+from types import MappingProxyType
+from typing import List, Dict, Final, Literal, Mapping, NamedTuple, Sequence, Tuple
 from dataclasses import dataclass
 
 
@@ -81,8 +85,7 @@ class SlapstickParameter(str, Enum):
 # LAYER 2: PROFILE STRUCTURES
 # ============================================================================
 
-@dataclass
-class SlapstickParameterSet:
+class SlapstickParameterSet(NamedTuple):
     """A set of slapstick parameter values (0-10)"""
     exaggeration: int
     timing: int
@@ -93,6 +96,7 @@ class SlapstickParameterSet:
     
     def to_dict(self) -> Dict[str, int]:
         """Convert to dictionary for serialization"""
+        # A literal dict is cheaper than _asdict()'s dict(zip(...))
         return {
             'exaggeration': self.exaggeration,
             'timing': self.timing,
@@ -104,11 +108,7 @@ class SlapstickParameterSet:
     
     def validate(self) -> bool:
         """Ensure all parameters are within bounds"""
-        for value in [self.exaggeration, self.timing, self.physical, 
-                      self.ruleOfThree, self.readability, self.tension]:
-            if not 0 <= value <= 10:
-                return False
-        return True
+        return 0 <= min(self) and max(self) <= 10
 
 
 @dataclass
@@ -134,13 +134,19 @@ class VisualPriorityBoost:
     boost_amount: int  # Usually +2
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DesignIntent:
     """Structured representation of creative intent"""
     subject_type: SubjectType
     emotional_tone: EmotionalTone
-    visual_priorities: List[VisualPriority]
+    visual_priorities: Tuple[VisualPriority, ...]  # Any iterable; stored as unique members in order
     intensity_level: IntensityLevel
+    
+    def __post_init__(self):
+        """Normalize priorities so repeating one does not boost its parameter again"""
+        object.__setattr__(
+            self, 'visual_priorities', tuple(dict.fromkeys(self.visual_priorities or ()))
+        )
 
 
 @dataclass
@@ -157,204 +163,289 @@ class SlapstickEnhancement:
 # LAYER 3: OLOG MORPHISMS (DETERMINISTIC MAPPINGS)
 # ============================================================================
 
-class SlapstickOlogMorphisms:
+# The morphism tables are read-only: the derived tables and caches below
+# are built from them once at import and would go stale if they changed.
+
+# Subject type presets (Morphism source: SubjectType → SlapstickParameterSet)
+SUBJECT_TYPE_PRESETS: Final = MappingProxyType({
+    SubjectType.ARCHITECTURE: SlapstickParameterSet(
+        exaggeration=7, timing=4, physical=6, ruleOfThree=7, readability=6, tension=8
+    ),
+    SubjectType.PORTRAIT: SlapstickParameterSet(
+        exaggeration=6, timing=5, physical=4, ruleOfThree=5, readability=8, tension=4
+    ),
+    SubjectType.STILL_LIFE: SlapstickParameterSet(
+        exaggeration=8, timing=6, physical=7, ruleOfThree=8, readability=7, tension=6
+    ),
+    SubjectType.LANDSCAPE: SlapstickParameterSet(
+        exaggeration=7, timing=7, physical=8, ruleOfThree=6, readability=5, tension=7
+    ),
+    SubjectType.ABSTRACT: SlapstickParameterSet(
+        exaggeration=9, timing=8, physical=9, ruleOfThree=7, readability=4, tension=8
+    ),
+    SubjectType.PRODUCT: SlapstickParameterSet(
+        exaggeration=8, timing=5, physical=6, ruleOfThree=7, readability=9, tension=5
+    ),
+    SubjectType.SCENE: SlapstickParameterSet(
+        exaggeration=6, timing=7, physical=7, ruleOfThree=6, readability=6, tension=7
+    ),
+})
+
+# Intensity multipliers (Morphism: IntensityLevel → float)
+INTENSITY_MULTIPLIERS: Final = MappingProxyType({
+    IntensityLevel.SUBTLE: 0.3,
+    IntensityLevel.MODERATE: 0.6,
+    IntensityLevel.STRONG: 0.85,
+    IntensityLevel.EXTREME: 1.0,
+})
+
+# Emotional tone modifiers (Morphism: EmotionalTone → parameter deltas)
+EMOTIONAL_TONE_MODIFIERS: Final = MappingProxyType({
+    EmotionalTone.PLAYFUL: MappingProxyType({'timing': +2, 'physical': +2, 'ruleOfThree': +1}),
+    EmotionalTone.TENSE: MappingProxyType({'tension': +3, 'physical': -1, 'readability': +1}),
+    EmotionalTone.ABSURD: MappingProxyType({'exaggeration': +3, 'physical': +2, 'readability': -2}),
+    EmotionalTone.WHIMSICAL: MappingProxyType({'timing': +2, 'ruleOfThree': +2, 'exaggeration': +1}),
+    EmotionalTone.SURREAL: MappingProxyType({'exaggeration': +3, 'physical': +3, 'readability': -1}),
+    EmotionalTone.DRAMATIC: MappingProxyType({'tension': +3, 'readability': +2, 'timing': +1}),
+    EmotionalTone.CHAOTIC: MappingProxyType({'exaggeration': +2, 'physical': +3, 'timing': +2, 'readability': -2}),
+    EmotionalTone.ELEGANT: MappingProxyType({'readability': +3, 'ruleOfThree': +2, 'timing': +1, 'physical': -1}),
+    EmotionalTone.OMINOUS: MappingProxyType({'tension': +4, 'timing': -1, 'readability': +1}),
+})
+
+# Visual priority boosts (Morphism: VisualPriority → parameter boost)
+VISUAL_PRIORITY_BOOSTS: Final = MappingProxyType({
+    VisualPriority.SCALE: 'exaggeration',
+    VisualPriority.PHYSICS: 'physical',
+    VisualPriority.REPETITION: 'ruleOfThree',
+    VisualPriority.CLARITY: 'readability',
+    VisualPriority.SUSPENSE: 'tension',
+    VisualPriority.RHYTHM: 'timing',
+    VisualPriority.DISTORTION: 'exaggeration',
+    VisualPriority.BALANCE: 'tension',
+    VisualPriority.FLOW: 'timing',
+    VisualPriority.IMPACT: 'physical',
+})
+
+# Parameter descriptions by bucket (Morphism: parameter value → description)
+# Buckets: 0-2, 3-5, 6-8, 9-10, split at _DESCRIPTION_CUTS
+_DESCRIPTION_CUTS = (3, 6, 9)
+_DESCRIPTION_TABLE = {
+    'exaggeration': (
+        "minimal exaggeration",
+        "subtle scale variations",
+        "obvious proportion exaggerations",
+        "extreme distortions with impossible scales",
+    ),
+    'timing': (
+        "static composition",
+        "gentle repetition",
+        "strong rhythmic composition",
+        "staccato visual interruptions",
+    ),
+    'physical': (
+        "realistic physics",
+        "subtle material flexibility",
+        "squash and stretch principles",
+        "extreme elasticity and squash-stretch",
+    ),
+    'ruleOfThree': (
+        "no triplet emphasis",
+        "subtle triplet hints",
+        "clear triplet groupings",
+        "complex triplet patterns",
+    ),
+    'readability': (
+        "complex visual details",
+        "subtle graphic emphasis",
+        "strong silhouette clarity",
+        "crystal clear graphic simplification",
+    ),
+    'tension': (
+        "peaceful balance",
+        "subtle tension",
+        "strong suspenseful moment",
+        "extreme precarious balance",
+    ),
+}
+
+
+# ============================================================================
+# PRECOMPUTED TABLES AND CACHED KERNELS
+# ============================================================================
+
+# Field order shared by every 6-value vector below
+_FIELD_INDEX = {name: i for i, name in enumerate(SlapstickParameterSet._fields)}
+
+# (SubjectType, IntensityLevel) -> subject preset scaled by the intensity multiplier
+_BASE_PARAMS = {
+    (subject_type, intensity_level): tuple(round(v * multiplier) for v in preset)
+    for subject_type, preset in SUBJECT_TYPE_PRESETS.items()
+    for intensity_level, multiplier in INTENSITY_MULTIPLIERS.items()
+}
+
+# Description rows in field order, so buckets are fetched by position.
+# Strings are interned so every cached description shares one copy.
+_DESCRIPTION_BUCKETS = tuple(
+    tuple(sys.intern(text) for text in _DESCRIPTION_TABLE[name])
+    for name in SlapstickParameterSet._fields
+)
+
+# EmotionalTone -> dense 6-tuple of deltas in field order (0 where the tone has no modifier)
+_TONE_DELTA_VEC = {
+    tone: tuple(modifiers.get(name, 0) for name in SlapstickParameterSet._fields)
+    for tone, modifiers in EMOTIONAL_TONE_MODIFIERS.items()
+}
+_ZERO_DELTAS = (0,) * len(SlapstickParameterSet._fields)
+
+# VisualPriority -> index of the field it boosts (every priority targets a real field)
+_PRIORITY_FIELD_IDX = {
+    priority: _FIELD_INDEX[name]
+    for priority, name in VISUAL_PRIORITY_BOOSTS.items()
+}
+
+
+def _morph(base, tone_deltas, boost_fields) -> List[int]:
     """
-    Deterministic morphisms for slapstick enhancement.
-    Maps design intent → parameters → enhanced prompts
+    Pure integer core of design_intent_to_parameters.
+    Takes the scaled subject preset as six ints and returns six ints in field order.
+    """
+    # Tone deltas clamp immediately: a boost after a negative delta starts from 0
+    values = [max(0, min(10, v + delta)) for v, delta in zip(base, tone_deltas)]
+    
+    # Everything is within 0-10 here and boosts only add, so only the upper bound applies
+    for i in boost_fields:
+        values[i] = min(10, values[i] + 2)
+    
+    return values
+
+
+@functools.lru_cache(maxsize=512)
+def _compute_params(
+    subject_type: SubjectType,
+    intensity_level: IntensityLevel,
+    emotional_tone: EmotionalTone,
+    priorities: Tuple[VisualPriority, ...],
+) -> SlapstickParameterSet:
     """
+    Cached body of design_intent_to_parameters, keyed on the hashable parts of a DesignIntent.
+    The returned SlapstickParameterSet is immutable, so it is safe to share between callers.
+    """
+    # Steps 1-2: Subject type preset with intensity multiplier applied (precomputed)
+    base = _BASE_PARAMS.get((subject_type, intensity_level))
+    if base is None:
+        # Unknown subject falls back to SCENE, unknown intensity to MODERATE
+        if subject_type not in SUBJECT_TYPE_PRESETS:
+            subject_type = SubjectType.SCENE
+        if intensity_level not in INTENSITY_MULTIPLIERS:
+            intensity_level = IntensityLevel.MODERATE
+        base = _BASE_PARAMS[(subject_type, intensity_level)]
     
-    # Subject type presets (Morphism source: SubjectType → SlapstickParameterSet)
-    SUBJECT_TYPE_PRESETS = {
-        SubjectType.ARCHITECTURE: SlapstickParameterSet(
-            exaggeration=7, timing=4, physical=6, ruleOfThree=7, readability=6, tension=8
-        ),
-        SubjectType.PORTRAIT: SlapstickParameterSet(
-            exaggeration=6, timing=5, physical=4, ruleOfThree=5, readability=8, tension=4
-        ),
-        SubjectType.STILL_LIFE: SlapstickParameterSet(
-            exaggeration=8, timing=6, physical=7, ruleOfThree=8, readability=7, tension=6
-        ),
-        SubjectType.LANDSCAPE: SlapstickParameterSet(
-            exaggeration=7, timing=7, physical=8, ruleOfThree=6, readability=5, tension=7
-        ),
-        SubjectType.ABSTRACT: SlapstickParameterSet(
-            exaggeration=9, timing=8, physical=9, ruleOfThree=7, readability=4, tension=8
-        ),
-        SubjectType.PRODUCT: SlapstickParameterSet(
-            exaggeration=8, timing=5, physical=6, ruleOfThree=7, readability=9, tension=5
-        ),
-        SubjectType.SCENE: SlapstickParameterSet(
-            exaggeration=6, timing=7, physical=7, ruleOfThree=6, readability=6, tension=7
-        ),
-    }
+    # Steps 3-5: Resolve tone and priorities to field indices, then run the integer kernel
+    tone_deltas = _TONE_DELTA_VEC.get(emotional_tone, _ZERO_DELTAS)
+    if priorities:
+        boost_fields = [_PRIORITY_FIELD_IDX[priority] for priority in priorities]
+    else:
+        boost_fields = ()
     
-    # Intensity multipliers (Morphism: IntensityLevel → float)
-    INTENSITY_MULTIPLIERS = {
-        IntensityLevel.SUBTLE: 0.3,
-        IntensityLevel.MODERATE: 0.6,
-        IntensityLevel.STRONG: 0.85,
-        IntensityLevel.EXTREME: 1.0,
-    }
+    return SlapstickParameterSet(*_morph(base, tone_deltas, boost_fields))
+
+
+@functools.lru_cache(maxsize=1024)
+def _descriptions(
+    exaggeration: int,
+    timing: int,
+    physical: int,
+    ruleOfThree: int,
+    readability: int,
+    tension: int,
+) -> Mapping[str, str]:
+    """
+    Cached body of parameters_to_enhancement_description, keyed on the six values.
+    Wrapped read-only since every caller with the same values shares the dict.
+    """
+    # Each ladder cuts 0-10 at the same points, so the bucket is the number of cuts reached
+    values = (exaggeration, timing, physical, ruleOfThree, readability, tension)
+    return MappingProxyType(dict(zip(
+        SlapstickParameterSet._fields,
+        [row[bisect_right(_DESCRIPTION_CUTS, value)] for row, value in zip(_DESCRIPTION_BUCKETS, values)],
+    )))
+
+
+# ============================================================================
+# MORPHISM INTERFACE
+# ============================================================================
+
+def design_intent_to_parameters(design_intent: DesignIntent) -> SlapstickParameterSet:
+    """
+    Convert design intent to slapstick parameters.
+    Morphism: DesignIntent → SlapstickParameterSet
+    """
+    # Order of priorities does not affect the result, so sort for a stable cache key
+    # (str enum members sort by value, so plain strings sort alongside them)
+    priorities = design_intent.visual_priorities
+    if len(priorities) > 1:
+        priorities = tuple(sorted(priorities))
+    return _compute_params(
+        design_intent.subject_type,
+        design_intent.intensity_level,
+        design_intent.emotional_tone,
+        priorities,
+    )
+
+
+def design_intents_to_parameters(design_intents: Sequence[DesignIntent]) -> List[SlapstickParameterSet]:
+    """
+    Convert many design intents to slapstick parameters.
+    Morphism: [DesignIntent] → [SlapstickParameterSet]
     
-    # Emotional tone modifiers (Morphism: EmotionalTone → parameter deltas)
-    EMOTIONAL_TONE_MODIFIERS = {
-        EmotionalTone.PLAYFUL: {'timing': +2, 'physical': +2, 'ruleOfThree': +1},
-        EmotionalTone.TENSE: {'tension': +3, 'physical': -1, 'readability': +1},
-        EmotionalTone.ABSURD: {'exaggeration': +3, 'physical': +2, 'readability': -2},
-        EmotionalTone.WHIMSICAL: {'timing': +2, 'ruleOfThree': +2, 'exaggeration': +1},
-        EmotionalTone.SURREAL: {'exaggeration': +3, 'physical': +3, 'readability': -1},
-        EmotionalTone.DRAMATIC: {'tension': +3, 'readability': +2, 'timing': +1},
-        EmotionalTone.CHAOTIC: {'exaggeration': +2, 'physical': +3, 'timing': +2, 'readability': -2},
-        EmotionalTone.ELEGANT: {'readability': +3, 'ruleOfThree': +2, 'timing': +1, 'physical': -1},
-        EmotionalTone.OMINOUS: {'tension': +4, 'timing': -1, 'readability': +1},
-    }
+    Batches typically repeat a handful of intents, which share the cached
+    per-intent result instead of being recomputed.
+    """
+    # Bind the adapter locally for the loop
+    to_parameters = design_intent_to_parameters
+    return [to_parameters(design_intent) for design_intent in design_intents]
+
+
+def validate_parameters(params: SlapstickParameterSet) -> bool:
+    """
+    Validate that parameter set is within bounds.
+    Morphism: SlapstickParameterSet → bool
+    """
+    return params.validate()
+
+
+def parameters_to_enhancement_description(params: SlapstickParameterSet) -> Mapping[str, str]:
+    """
+    Convert parameters to human-readable descriptions.
+    Morphism: SlapstickParameterSet → Enhancement descriptions
     
-    # Visual priority boosts (Morphism: VisualPriority → parameter boost)
-    VISUAL_PRIORITY_BOOSTS = {
-        VisualPriority.SCALE: 'exaggeration',
-        VisualPriority.PHYSICS: 'physical',
-        VisualPriority.REPETITION: 'ruleOfThree',
-        VisualPriority.CLARITY: 'readability',
-        VisualPriority.SUSPENSE: 'tension',
-        VisualPriority.RHYTHM: 'timing',
-        VisualPriority.DISTORTION: 'exaggeration',
-        VisualPriority.BALANCE: 'tension',
-        VisualPriority.FLOW: 'timing',
-        VisualPriority.IMPACT: 'physical',
-    }
+    Returns a read-only view of a cached dict; copy it to add keys.
+    """
+    return _descriptions(
+        params.exaggeration,
+        params.timing,
+        params.physical,
+        params.ruleOfThree,
+        params.readability,
+        params.tension,
+    )
+
+
+class SlapstickOlogMorphisms:
+    """
+    Deterministic morphisms for slapstick enhancement.
+    Maps design intent → parameters → enhanced prompts
     
-    @staticmethod
-    def design_intent_to_parameters(design_intent: DesignIntent) -> SlapstickParameterSet:
-        """
-        Convert design intent to slapstick parameters.
-        Morphism: DesignIntent → SlapstickParameterSet
-        """
-        
-        # Step 1: Get subject type preset
-        subject_params = SlapstickOlogMorphisms.SUBJECT_TYPE_PRESETS.get(
-            design_intent.subject_type,
-            SlapstickOlogMorphisms.SUBJECT_TYPE_PRESETS[SubjectType.SCENE]
-        )
-        
-        # Step 2: Apply intensity multiplier
-        multiplier = SlapstickOlogMorphisms.INTENSITY_MULTIPLIERS.get(
-            design_intent.intensity_level,
-            SlapstickOlogMorphisms.INTENSITY_MULTIPLIERS[IntensityLevel.MODERATE]
-        )
-        
-        params = {
-            'exaggeration': round(subject_params.exaggeration * multiplier),
-            'timing': round(subject_params.timing * multiplier),
-            'physical': round(subject_params.physical * multiplier),
-            'ruleOfThree': round(subject_params.ruleOfThree * multiplier),
-            'readability': round(subject_params.readability * multiplier),
-            'tension': round(subject_params.tension * multiplier),
-        }
-        
-        # Step 3: Apply emotional tone modifiers
-        modifiers = SlapstickOlogMorphisms.EMOTIONAL_TONE_MODIFIERS.get(
-            design_intent.emotional_tone,
-            {}
-        )
-        
-        for param_name, delta in modifiers.items():
-            if param_name in params:
-                params[param_name] = max(0, min(10, params[param_name] + delta))
-        
-        # Step 4: Apply visual priority boosts
-        for priority in design_intent.visual_priorities:
-            target_param = SlapstickOlogMorphisms.VISUAL_PRIORITY_BOOSTS.get(priority)
-            if target_param and target_param in params:
-                params[target_param] = min(10, params[target_param] + 2)
-        
-        # Step 5: Ensure all values are within bounds
-        for key in params:
-            params[key] = max(0, min(10, round(params[key])))
-        
-        return SlapstickParameterSet(
-            exaggeration=params['exaggeration'],
-            timing=params['timing'],
-            physical=params['physical'],
-            ruleOfThree=params['ruleOfThree'],
-            readability=params['readability'],
-            tension=params['tension'],
-        )
+    Namespace kept for backwards compatibility; the tables and morphisms
+    live at module level.
+    """
     
-    @staticmethod
-    def validate_parameters(params: SlapstickParameterSet) -> bool:
-        """
-        Validate that parameter set is within bounds.
-        Morphism: SlapstickParameterSet → bool
-        """
-        return params.validate()
+    SUBJECT_TYPE_PRESETS = SUBJECT_TYPE_PRESETS
+    INTENSITY_MULTIPLIERS = INTENSITY_MULTIPLIERS
+    EMOTIONAL_TONE_MODIFIERS = EMOTIONAL_TONE_MODIFIERS
+    VISUAL_PRIORITY_BOOSTS = VISUAL_PRIORITY_BOOSTS
     
-    @staticmethod
-    def parameters_to_enhancement_description(params: SlapstickParameterSet) -> Dict[str, str]:
-        """
-        Convert parameters to human-readable descriptions.
-        Morphism: SlapstickParameterSet → Enhancement descriptions
-        """
-        
-        descriptions = {}
-        
-        # Exaggeration description
-        if params.exaggeration >= 9:
-            descriptions['exaggeration'] = "extreme distortions with impossible scales"
-        elif params.exaggeration >= 6:
-            descriptions['exaggeration'] = "obvious proportion exaggerations"
-        elif params.exaggeration >= 3:
-            descriptions['exaggeration'] = "subtle scale variations"
-        else:
-            descriptions['exaggeration'] = "minimal exaggeration"
-        
-        # Timing description
-        if params.timing >= 9:
-            descriptions['timing'] = "staccato visual interruptions"
-        elif params.timing >= 6:
-            descriptions['timing'] = "strong rhythmic composition"
-        elif params.timing >= 3:
-            descriptions['timing'] = "gentle repetition"
-        else:
-            descriptions['timing'] = "static composition"
-        
-        # Physical description
-        if params.physical >= 9:
-            descriptions['physical'] = "extreme elasticity and squash-stretch"
-        elif params.physical >= 6:
-            descriptions['physical'] = "squash and stretch principles"
-        elif params.physical >= 3:
-            descriptions['physical'] = "subtle material flexibility"
-        else:
-            descriptions['physical'] = "realistic physics"
-        
-        # Rule of three description
-        if params.ruleOfThree >= 9:
-            descriptions['ruleOfThree'] = "complex triplet patterns"
-        elif params.ruleOfThree >= 6:
-            descriptions['ruleOfThree'] = "clear triplet groupings"
-        elif params.ruleOfThree >= 3:
-            descriptions['ruleOfThree'] = "subtle triplet hints"
-        else:
-            descriptions['ruleOfThree'] = "no triplet emphasis"
-        
-        # Readability description
-        if params.readability >= 9:
-            descriptions['readability'] = "crystal clear graphic simplification"
-        elif params.readability >= 6:
-            descriptions['readability'] = "strong silhouette clarity"
-        elif params.readability >= 3:
-            descriptions['readability'] = "subtle graphic emphasis"
-        else:
-            descriptions['readability'] = "complex visual details"
-        
-        # Tension description
-        if params.tension >= 9:
-            descriptions['tension'] = "extreme precarious balance"
-        elif params.tension >= 6:
-            descriptions['tension'] = "strong suspenseful moment"
-        elif params.tension >= 3:
-            descriptions['tension'] = "subtle tension"
-        else:
-            descriptions['tension'] = "peaceful balance"
-        
-        return descriptions
+    design_intent_to_parameters = staticmethod(design_intent_to_parameters)
+    design_intents_to_parameters = staticmethod(design_intents_to_parameters)
+    validate_parameters = staticmethod(validate_parameters)
+    parameters_to_enhancement_description = staticmethod(parameters_to_enhancement_description)